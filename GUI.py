@@ -4,7 +4,7 @@ from threading import Thread
 from tkinter import messagebox, ttk, filedialog
 
 # Import your YouTube downloader script functions
-from YouMain import download_video_with_options, move_thumbnails, remove_ytdl_files
+from YouMain import download_video_with_options, tidy_downloads
 
 
 class YouTubeDownloaderGUI:
@@ -95,8 +95,7 @@ class YouTubeDownloaderGUI:
             self.progress_bar.start()
 
             download_video_with_options(video_url, file_location, options)
-            move_thumbnails(file_location, os.path.join(file_location, 'thumbnails'))
-            remove_ytdl_files(file_location)
+            tidy_downloads(file_location, os.path.join(file_location, 'thumbnails'))
             messagebox.showinfo("Success", "Download completed successfully.")
 
         except Exception as e:
@@ -8,28 +8,40 @@ Requirements:
 - yt_dlp library (install using: pip install yt-dlp)
 
 Usage:
-1. Run the script.
-2. Enter a valid YouTube video URL.
+1. Run the script (optionally with --workers N to tune download parallelism).
+2. Enter one or more YouTube video URLs (comma-separated, or one per line;
+   finish with an empty line).
 3. Specify the file location to save downloaded files.
 4. Customize video quality, audio format, and subtitles (optional).
-5. The script will download the video, associated subtitles, and thumbnail.
+5. The script will download the videos in parallel, with associated subtitles and thumbnails.
 6. Thumbnails will be moved to a 'thumbnails' folder within the specified location.
 
 Author: RhaZenZ0
 """
 
+import argparse
+import atexit
+import functools
 import logging
 import os
+import pathlib
+import queue
 import re
-import shutil
 import subprocess
 import sys
+import threading
 import time
-from os import system, name
-from typing import Dict, Optional
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, List, Optional
 
+import diskcache
 import yt_dlp
 
+try:
+    import liburing
+except ImportError:
+    liburing = None
+
 
 class Tcolors:
     cyan = '\033[96m'
@@ -44,40 +56,124 @@ class Tcolors:
 
 logger = logging.getLogger(__name__)
 FILE_EXTENSIONS = ('.webp', '.png', '.jpg', '.jpeg')
+YOUTUBE_URL_PATTERN = re.compile(r'^(https?://)?(www\.)?(youtube|youtu|youtube-nocookie)\.(com|be)/.*$')
 DEFAULT_VIDEO_QUALITY = 'best'
 DEFAULT_AUDIO_FORMAT = 'best'
 DEFAULT_SUBTITLES = True
+DEFAULT_WORKERS = 4
+DEFAULT_FRAGMENT_WORKERS = 8
+HTTP_CHUNK_SIZE = 10485760  # 10 MiB
+CACHE_DIR = os.path.expanduser(os.path.join('~', '.cache', 'youmain'))
+CACHE_TTL = 86400  # seconds
 
+metadata_cache = diskcache.Cache(CACHE_DIR)
 
-def configure_logging():
-    # Disable logging
-    logging.disable(logging.CRITICAL)
-    check_yt_dlp_availability()
+# One YoutubeDL per worker thread, reused across URLs and batches so extractor
+# setup is paid once and HTTP connections to the CDN stay pooled
+_thread_ydl = threading.local()
+_ydl_instances = []
+_ydl_instances_lock = threading.Lock()
+_download_executor: Optional[ThreadPoolExecutor] = None
 
 
-def check_yt_dlp_availability():
-    try:
-        subprocess.run(['yt-dlp', '--version'], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True)
-        print("yt-dlp is installed and available.")
-    except subprocess.CalledProcessError:
-        print("yt-dlp is not installed")
-        time.sleep(5)
-        sys.exit()
+def get_thread_ydl(ydl_opts: Dict) -> yt_dlp.YoutubeDL:
+    """
+    Returns the calling thread's cached YoutubeDL instance.
+
+    The instance is built on first use and its params are updated in place on
+    later calls, instead of re-initializing extractors and the HTTP session
+    for every URL.
 
+    Parameters:
+    - ydl_opts (dict): The YoutubeDL options for this download.
+    """
+    ydl = getattr(_thread_ydl, 'instance', None)
+    if ydl is None:
+        ydl = yt_dlp.YoutubeDL(ydl_opts)
+        _thread_ydl.instance = ydl
+        with _ydl_instances_lock:
+            _ydl_instances.append(ydl)
+    else:
+        new_opts = dict(ydl_opts)
+        # __init__ normalized params['outtmpl'] into a dict, so the raw
+        # template string must not round-trip through params.update
+        new_outtmpl = new_opts.pop('outtmpl', None)
+        new_format = new_opts.get('format')
+        format_changed = new_format != ydl.params.get('format')
+        ydl.params.update(new_opts)
+        if new_outtmpl is not None:
+            if isinstance(ydl.params.get('outtmpl'), dict):
+                ydl.params['outtmpl']['default'] = new_outtmpl
+            else:
+                ydl.params['outtmpl'] = new_outtmpl
+        if format_changed:
+            # YoutubeDL builds its format selector once in __init__, so a
+            # params update alone would keep downloading the old format
+            ydl.format_selector = ydl.build_format_selector(new_format)
+    return ydl
+
+
+def get_download_executor(workers: int) -> ThreadPoolExecutor:
+    # Created once and kept alive so worker threads (and their cached
+    # YoutubeDL instances) survive across batches
+    global _download_executor
+    if _download_executor is None:
+        _download_executor = ThreadPoolExecutor(max_workers=workers)
+    return _download_executor
+
+
+@atexit.register
+def _close_ydl_instances() -> None:
+    with _ydl_instances_lock:
+        for ydl in _ydl_instances:
+            ydl.close()
+        _ydl_instances.clear()
 
+
+def configure_logging():
+    # Silence this logger without mutating global logging state; the level
+    # guard lets isEnabledFor short-circuit before messages are formatted
+    logger.addHandler(logging.NullHandler())
+    logger.setLevel(logging.CRITICAL + 1)
+    # yt_dlp is already imported, so no subprocess version check is needed
+    print(f"yt-dlp {yt_dlp.version.__version__} available")
+
+
+@functools.lru_cache(maxsize=1024)
 def is_valid_url(url: str) -> bool:
-    # Basic YouTube URL validation
-    youtube_url_pattern = re.compile(r'^(https?://)?(www\.)?(youtube|youtu|youtube-nocookie)\.(com|be)/.*$')
-    return bool(re.match(youtube_url_pattern, url))
+    # Basic YouTube URL validation; cached so repeated batch entries are O(1)
+    return YOUTUBE_URL_PATTERN.match(url) is not None
 
 
-def is_valid_directory(directory: str) -> bool:
-    return os.path.isdir(directory)
+def extract_video_id(video_url: str) -> Optional[str]:
+    # Pull the 11-character video ID out of the common YouTube URL shapes
+    match = re.search(r'(?:v=|youtu\.be/|/shorts/|/embed/)([0-9A-Za-z_-]{11})', video_url)
+    return match.group(1) if match else None
 
 
-def sanitize_file_path(file_path: str) -> str:
-    # Use os.path.join for safe path concatenation
-    return os.path.normpath(file_path)
+def fetch_video_info(ydl: yt_dlp.YoutubeDL, video_url: str) -> Optional[Dict]:
+    """
+    Fetches the metadata info dict for a video, using the on-disk cache when possible.
+
+    Parameters:
+    - ydl (yt_dlp.YoutubeDL): The YoutubeDL instance to extract with on a cache miss.
+    - video_url (str): The YouTube video URL.
+
+    Returns:
+    - dict: The info dict for the video, or None if extraction failed.
+    """
+    video_id = extract_video_id(video_url)
+    if video_id:
+        info = metadata_cache.get(video_id)
+        if info is not None:
+            return info
+    info = ydl.extract_info(video_url, download=False)
+    # A watch?v=<id>&list=<...> URL can resolve to a whole playlist; caching
+    # that under the bare video ID would replay the playlist for plain
+    # watch?v=<id> lookups later
+    if video_id and info is not None and info.get('id') == video_id:
+        metadata_cache.set(video_id, info, expire=CACHE_TTL)
+    return info
 
 
 def get_user_options() -> Dict[str, str]:
@@ -97,87 +193,355 @@ def get_user_options() -> Dict[str, str]:
     return options
 
 
-# Function to move thumbnails
-def move_thumbnails(source_folder: str, destination_folder: str) -> None:
+def get_video_urls() -> List[str]:
+    """
+    Reads a batch of YouTube video URLs from the user.
+
+    URLs may be entered comma-separated on one line or one per line; an empty
+    line finishes the batch.
+
+    Returns:
+    - list: The entered URLs, stripped and with empties removed.
+    """
+    print(f"{Tcolors.cyan}\nEnter YouTube video URLs (comma-separated or one per line, "
+          f"empty line to finish):{Tcolors.clear}")
+    urls = []
+    while True:
+        line = input().strip()
+        if not line:
+            break
+        urls.extend(url.strip() for url in line.split(',') if url.strip())
+    return urls
+
+
+def read_batch_file(path: str) -> List[str]:
+    """
+    Reads YouTube video URLs from a batch file.
+
+    Blank lines and lines starting with '#' are ignored.
+
+    Parameters:
+    - path (str): The path to the batch file.
+
+    Returns:
+    - list: The URLs listed in the file.
+    """
+    with open(path) as batch_file:
+        return [line.strip() for line in batch_file
+                if line.strip() and not line.startswith('#')]
+
+
+# Function to tidy up leftover files after a batch
+def tidy_downloads(source_folder: str, thumbnails_folder: str) -> None:
     """
-    Moves thumbnail files from the source folder to the destination folder.
+    Moves thumbnails into their folder and removes stale .ytdl files.
+
+    Both cleanup steps share a single os.scandir pass instead of enumerating
+    the directory once per step.
 
     Parameters:
-    - source_folder (str): The source folder containing thumbnail files.
-    - destination_folder (str): The destination folder to move thumbnail files to.
+    - source_folder (str): The folder the batch was downloaded into.
+    - thumbnails_folder (str): The destination folder for thumbnail files.
     """
-    if not os.path.exists(destination_folder):
-        os.makedirs(destination_folder)
-    files_to_move = [file for file in os.listdir(source_folder) if file.endswith(FILE_EXTENSIONS)]
-    for file in files_to_move:
-        source_path = os.path.join(source_folder, file)
-        destination_path = os.path.join(destination_folder, file)
-        shutil.move(source_path, destination_path)
-        print(f"Thumbnail '{file}' moved to '{destination_folder}'")
-        time.sleep(1)
+    os.makedirs(thumbnails_folder, exist_ok=True)
+    thumbnails = []
+    ytdl_paths = []
+    with os.scandir(source_folder) as entries:
+        for entry in entries:
+            if not entry.is_file():
+                continue
+            lowered = entry.name.lower()
+            if lowered.endswith(FILE_EXTENSIONS):
+                thumbnails.append(entry)
+            elif lowered.endswith('.ytdl'):
+                ytdl_paths.append(entry.path)
+
+    if thumbnails:
+        # Each move is a single rename syscall, so a small pool batches the
+        # filesystem metadata updates instead of waiting on them one by one
+        with ThreadPoolExecutor(max_workers=min(len(thumbnails), 8)) as executor:
+            list(executor.map(
+                lambda entry: os.replace(entry.path, os.path.join(thumbnails_folder, entry.name)),
+                thumbnails))
+        print(f"Moved {len(thumbnails)} thumbnail{'s' if len(thumbnails) != 1 else ''} "
+              f"to '{thumbnails_folder}'")
+
+    remove_files(ytdl_paths)
+
+
+def remove_files(paths: List[str]) -> None:
+    """
+    Removes the given files, batching the unlinks through io_uring when possible.
+
+    Parameters:
+    - paths (list): The file paths to remove.
+    """
+    # Batched submission only pays off once there are a handful of files
+    if liburing is not None and sys.platform == 'linux' and len(paths) >= 4:
+        try:
+            batch_unlink(paths)
+            return
+        except (OSError, AttributeError, TypeError) as error:
+            # AttributeError/TypeError cover binding API mismatches, not just
+            # kernel-side failures
+            if logger.isEnabledFor(logging.ERROR):
+                logger.error(f"io_uring unlink failed, falling back: {error}")
+    for path in paths:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            # A failed batch may have unlinked some of the paths already
+            pass
 
 
-def remove_ytdl_files(directory: str) -> None:
+def batch_unlink(paths: List[str]) -> None:
     """
-    Removes files with the .ytdl extension from the specified directory.
+    Unlinks all given paths with a single io_uring submission.
+
+    Queues one unlink entry per file and submits them with one
+    io_uring_enter call, instead of one unlink syscall per file.
 
     Parameters:
-    - directory (str): The directory to remove .ytdl files from.
+    - paths (list): The file paths to remove.
     """
-    files_to_remove = [file for file in os.listdir(directory) if file.endswith('.ytdl')]
-    for file in files_to_remove:
-        file_path = os.path.join(directory, file)
-        os.remove(file_path)
+    ring = liburing.Ring()
+    liburing.io_uring_queue_init(len(paths), ring)
+    try:
+        # The binding reads the path buffers at submit time, so the Path
+        # objects must stay alive until then
+        path_objects = [pathlib.Path(path) for path in paths]
+        for path in path_objects:
+            sqe = liburing.io_uring_get_sqe(ring)
+            liburing.io_uring_prep_unlink(sqe, path)
+        liburing.io_uring_submit_and_wait(ring, len(path_objects))
+        cqe = liburing.Cqe()
+        for _ in path_objects:
+            liburing.io_uring_wait_cqe(ring, cqe)
+            entry = cqe[0]
+            liburing.trap_error(entry.res)
+            liburing.io_uring_cqe_seen(ring, entry)
+    finally:
+        liburing.io_uring_queue_exit(ring)
+
+
+def build_ydl_opts(file_location: str, user_options: Dict[str, str],
+                   fragment_workers: int = DEFAULT_FRAGMENT_WORKERS) -> Dict:
+    """
+    Builds the YoutubeDL options for the download pass.
 
+    Post-processing is deliberately left out so that ffmpeg work can run on a
+    separate thread while the next download is in flight.
 
-# Function to download video with options
-def download_video_with_options(video_url: str, file_location: str, user_options: Dict[str, str]) -> None:
+    Parameters:
+    - file_location (str): The file location to save the downloaded video.
+    - user_options (dict): User-specified options for video quality, audio format, and subtitles.
+    - fragment_workers (int): How many HLS/DASH fragments to fetch in parallel.
     """
-    Downloads a YouTube video using yt_dlp with user-specified options and saves it to the specified file location.
+    return {
+        'format': f'bestvideo[ext=mp4]+bestaudio[ext={user_options["audio_format"]}]/bestvideo+bestaudio/'
+                  f'{user_options["video_quality"]}',
+        'download_archive': 'downloaded_songs.txt',
+        'windowsfilenames': True,
+        'quiet': True,
+        'no_warnings': True,
+
+        'outtmpl': os.path.join(file_location, '%(title)s.%(ext)s'),
+        'writesubtitles': user_options['subtitles'],
+        'subtitleslangs': ['en', '-live_chat'],
+        'writethumbnail': True,
+        'embedthumbnail': True,
+        'ignoreerrors': True,
+        'concurrent_fragment_downloads': fragment_workers,
+        'http_chunk_size': HTTP_CHUNK_SIZE,
+        'retries': 3,
+        'fragment_retries': 3,
+        "error_logger": logger,
+        'postprocessors': [],
+    }
+
+
+# Function to download video (without post-processing)
+def download_video(video_url: str, file_location: str, user_options: Dict[str, str],
+                   fragment_workers: int = DEFAULT_FRAGMENT_WORKERS) -> Optional[Dict]:
+    """
+    Downloads a YouTube video using yt_dlp and returns its info dict for post-processing.
+
+    Each worker thread reuses its own cached YoutubeDL instance, so it is safe
+    to run from multiple worker threads at once.
 
     Parameters:
     - video_url (str): The YouTube video URL.
     - file_location (str): The file location to save the downloaded video.
     - user_options (dict): User-specified options for video quality, audio format, and subtitles.
+
+    Returns:
+    - dict: The info dict of the downloaded video, or None if the download failed.
     """
     try:
-        ydl_opts = {
-            'format': f'bestvideo[ext=mp4]+bestaudio[ext={user_options["audio_format"]}]/bestvideo+bestaudio/'
-                      f'{user_options["video_quality"]}',
-            'download_archive': 'downloaded_songs.txt',
-            'windowsfilenames': True,
-            'quiet': True,
-            'no_warnings': True,
-            
-            'outtmpl': os.path.join(file_location, '%(title)s.%(ext)s'),
-            'writesubtitles': user_options['subtitles'],
-            'subtitleslangs': ['en', '-live_chat'],
-            'writethumbnail': True,
-            'embedthumbnail': True,
-            'ignoreerrors': True,
-            "error_logger": logger,
-            'postprocessors': [
-                {'key': 'FFmpegMetadata', 'add_metadata': True},
-                {'key': 'FFmpegEmbedSubtitle'},
-                {'key': 'EmbedThumbnail', 'already_have_thumbnail': True},
-            ],
-        }
-
-        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-            ydl.download([video_url])
+        ydl = get_thread_ydl(build_ydl_opts(file_location, user_options, fragment_workers))
+        info = fetch_video_info(ydl, video_url)
+        if info is not None:
+            info = ydl.process_ie_result(info, download=True)
+        return info
 
     except yt_dlp.utils.DownloadError as error:
-        logger.error(f"Error downloading video: {error}")
+        if logger.isEnabledFor(logging.ERROR):
+            logger.error(f"Error downloading video: {error}")
         print(f"{Tcolors.red}Error: {error}{Tcolors.clear}")
+        return None
+
+
+def find_sidecar_file(stem: str, extensions: tuple) -> Optional[str]:
+    # Locates a file written next to the video (thumbnail or subtitle) by extension
+    for extension in extensions:
+        path = stem + extension
+        if os.path.exists(path):
+            return path
+    return None
+
+
+# Function to run the ffmpeg post-processing on a downloaded video or playlist
+def postprocess_video(info: Dict, ffmpeg_threads: Optional[int] = None) -> None:
+    """
+    Embeds metadata, subtitles, and thumbnails into already-downloaded videos.
+
+    Playlist info dicts are unpacked so every entry gets post-processed, and
+    each downloaded file of an entry is muxed individually.
+
+    Parameters:
+    - info (dict): The info dict returned by download_video.
+    - ffmpeg_threads (int): Thread cap per ffmpeg invocation, or None for ffmpeg's default.
+    """
+    if info.get('entries') is not None:
+        for entry in info['entries']:
+            if entry:
+                postprocess_video(entry, ffmpeg_threads)
+        return
+
+    filepaths = [download.get('filepath') for download in info.get('requested_downloads', [])]
+    if not filepaths and info.get('filepath'):
+        filepaths = [info['filepath']]
+    for filepath in filepaths:
+        if filepath and os.path.exists(filepath):
+            mux_video(filepath, info, ffmpeg_threads)
+
+
+# Function to mux metadata, subtitles, and the thumbnail into one file
+def mux_video(filepath: str, info: Dict, ffmpeg_threads: Optional[int] = None) -> None:
+    """
+    Embeds metadata, subtitles, and the thumbnail into a downloaded file.
+
+    Everything is done in a single ffmpeg remux (stream copy, no re-encode)
+    instead of one ffmpeg invocation per post-processor.
+
+    Parameters:
+    - filepath (str): The downloaded video file.
+    - info (dict): The info dict the file belongs to.
+    - ffmpeg_threads (int): Thread cap for the ffmpeg invocation, or None for ffmpeg's default.
+    """
+    stem, extension = os.path.splitext(filepath)
+    thumbnail = find_sidecar_file(stem, FILE_EXTENSIONS)
+    subtitle = find_sidecar_file(stem, ('.en.srt', '.en.vtt', '.srt', '.vtt'))
+
+    command = ['ffmpeg', '-y', '-loglevel', 'error', '-i', filepath]
+    if subtitle:
+        command += ['-i', subtitle]
+    if thumbnail:
+        command += ['-i', thumbnail]
+
+    command += ['-map', '0']
+    input_index = 1
+    if subtitle:
+        command += ['-map', str(input_index)]
+        input_index += 1
+    if thumbnail:
+        command += ['-map', str(input_index)]
+
+    command += ['-c', 'copy']
+    if ffmpeg_threads:
+        # Keep concurrent invocations from each spawning ffmpeg's default
+        # thread count and over-subscribing the CPU
+        command += ['-threads', str(ffmpeg_threads)]
+    if subtitle and extension == '.mp4':
+        # mp4 cannot carry copied text subtitles; mov_text is the container-native codec
+        command += ['-c:s', 'mov_text']
+    if thumbnail:
+        command += ['-disposition:v:1', 'attached_pic']
+        if not thumbnail.lower().endswith(('.jpg', '.jpeg', '.png')):
+            # webp streams cannot be stream-copied into mp4 or mkv; re-encode
+            # the image to mjpeg, which both containers accept as cover art
+            command += ['-c:v:1', 'mjpeg']
+
+    for key, value in (('title', info.get('title')),
+                       ('artist', info.get('uploader')),
+                       ('date', info.get('upload_date')),
+                       ('comment', info.get('webpage_url'))):
+        if value:
+            command += ['-metadata', f'{key}={value}']
+
+    temp_path = f'{stem}.temp{extension}'
+    command.append(temp_path)
+
+    try:
+        subprocess.run(command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True)
+        os.replace(temp_path, filepath)
+    except (subprocess.CalledProcessError, OSError) as error:
+        if logger.isEnabledFor(logging.ERROR):
+            logger.error(f"Error post-processing video: {error}")
+        print(f"{Tcolors.red}Error: {error}{Tcolors.clear}")
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+    else:
+        # The subtitle now lives inside the container; the thumbnail sidecar
+        # is kept for tidy_downloads to move into the thumbnails folder
+        if subtitle:
+            os.remove(subtitle)
+
+
+def ffmpeg_worker(pp_queue: 'queue.Queue[Optional[Dict]]',
+                  ffmpeg_threads: Optional[int] = None) -> None:
+    """
+    Consumes downloaded videos from the queue and post-processes them.
+
+    Runs on its own thread so ffmpeg work on video N overlaps the download of
+    video N+1. A None item shuts the worker down.
+
+    Parameters:
+    - pp_queue (queue.Queue): The queue connecting downloads to post-processing.
+    - ffmpeg_threads (int): Thread cap for each ffmpeg invocation, or None for ffmpeg's default.
+    """
+    while True:
+        info = pp_queue.get()
+        if info is None:
+            break
+        postprocess_video(info, ffmpeg_threads)
+
+
+# Function to download video with options
+def download_video_with_options(video_url: str, file_location: str, user_options: Dict[str, str]) -> None:
+    """
+    Downloads a YouTube video using yt_dlp with user-specified options and saves it to the specified file location.
+
+    Convenience wrapper that runs the download and post-processing passes back to back.
+
+    Parameters:
+    - video_url (str): The YouTube video URL.
+    - file_location (str): The file location to save the downloaded video.
+    - user_options (dict): User-specified options for video quality, audio format, and subtitles.
+    """
+    info = download_video(video_url, file_location, user_options)
+    if info is not None:
+        postprocess_video(info)
 
 
 # Function to clear the console
 def clear_console() -> None:
-    system('cls' if name == 'nt' else 'clear')
+    # ANSI clear-screen + home; avoids forking a cls/clear subprocess
+    print('\033[2J\033[H', end='')
 
 
 def first_clear():
-    system('cls' if name == 'nt' else 'clear')
+    clear_console()
     print(f"{Tcolors.bold}YouTube Downloader{Tcolors.clear}")
     print(f"{Tcolors.gray}Written in Python 3.11*")
     print(f"{Tcolors.red}By RhaZenZ0{Tcolors.clear}")
@@ -185,13 +549,14 @@ def first_clear():
 
 
 # Function to start again
-def start_again(prev_file_location: str) -> None:
+def start_again() -> None:
+    # Returns to let run()'s loop continue, so the tuning knobs it was
+    # started with stay in effect; closes the program on 'n'
     while True:
         ans = input(f"{Tcolors.cyan}\nDo you want to start again? (y/n) " + Tcolors.clear).strip().lower()
         if ans == "y":
             clear_console()
-            time.sleep(0)
-            run(prev_file_location)
+            return
         elif ans == 'n':
             clear_console()
             close()
@@ -201,22 +566,102 @@ def start_again(prev_file_location: str) -> None:
 
 # Function to close the program
 def close() -> None:
-    time.sleep(0)
     print('\nBye')
-    time.sleep(1)
     sys.exit()
 
 
+# Function to download a batch of URLs through the parallel pipeline
+def download_batch(video_urls: List[str], file_location: str, user_options: Dict[str, str],
+                   workers: int = DEFAULT_WORKERS,
+                   fragment_workers: int = DEFAULT_FRAGMENT_WORKERS,
+                   ffmpeg_threads: Optional[int] = None) -> None:
+    """
+    Downloads a batch of YouTube videos in parallel and tidies up afterwards.
+
+    Parameters:
+    - video_urls (list): The YouTube video URLs to download.
+    - file_location (str): The file location to save the downloaded videos.
+    - user_options (dict): User-specified options for video quality, audio format, and subtitles.
+    - workers (int): How many downloads to run in parallel.
+    - fragment_workers (int): How many HLS/DASH fragments to fetch in parallel per download.
+    - ffmpeg_threads (int): Thread cap per ffmpeg invocation; defaults to cpu_count // workers.
+    """
+    if ffmpeg_threads is None:
+        ffmpeg_threads = max(1, (os.cpu_count() or workers) // workers)
+    pp_queue: 'queue.Queue[Optional[Dict]]' = queue.Queue(maxsize=2)
+    pp_thread = threading.Thread(target=ffmpeg_worker, args=(pp_queue, ffmpeg_threads), daemon=True)
+    pp_thread.start()
+    executor = get_download_executor(workers)
+    futures = [
+        executor.submit(download_video, url, file_location, user_options, fragment_workers)
+        for url in video_urls
+    ]
+    for future in as_completed(futures):
+        try:
+            info = future.result()
+        except Exception as e:
+            if logger.isEnabledFor(logging.ERROR):
+                logger.error(f"Error during download: {e}")
+            print(f"{Tcolors.red}Error: {e}{Tcolors.clear}")
+        else:
+            if info is not None:
+                pp_queue.put(info)
+    pp_queue.put(None)
+    pp_thread.join()
+
+    tidy_downloads(file_location, os.path.join(file_location, 'thumbnails'))
+
+
+# Function to download a batch of URLs without any interactive prompts
+def run_batch(video_urls: List[str], file_location: str, workers: int = DEFAULT_WORKERS,
+              fragment_workers: int = DEFAULT_FRAGMENT_WORKERS,
+              ffmpeg_threads: Optional[int] = None) -> None:
+    """
+    Validates and downloads a batch of URLs supplied via --batch-file/--urls.
+
+    All URLs are checked before any download starts; a single bad URL aborts
+    the whole batch so nothing is half-done.
+
+    Parameters:
+    - video_urls (list): The YouTube video URLs to download.
+    - file_location (str): The file location to save the downloaded videos.
+    - workers (int): How many downloads to run in parallel.
+    - fragment_workers (int): How many HLS/DASH fragments to fetch in parallel per download.
+    """
+    invalid_urls = [url for url in video_urls if not is_valid_url(url)]
+    if invalid_urls:
+        for url in invalid_urls:
+            print(f"{Tcolors.red}Error: Invalid YouTube video URL: {url}{Tcolors.clear}")
+        sys.exit(1)
+
+    sanitized_location = os.path.normpath(file_location)
+    if not os.path.isdir(sanitized_location):
+        print(f"{Tcolors.red}Error: Invalid file location{Tcolors.clear}")
+        sys.exit(1)
+
+    user_options = {
+        'video_quality': DEFAULT_VIDEO_QUALITY,
+        'audio_format': DEFAULT_AUDIO_FORMAT,
+        'subtitles': DEFAULT_SUBTITLES,
+    }
+    download_batch(video_urls, sanitized_location, user_options, workers, fragment_workers,
+                   ffmpeg_threads)
+
+
 # Function to run the program
-def run(prev_file_location: Optional[str] = None) -> None:
+def run(prev_file_location: Optional[str] = None, workers: int = DEFAULT_WORKERS,
+        fragment_workers: int = DEFAULT_FRAGMENT_WORKERS,
+        ffmpeg_threads: Optional[int] = None) -> None:
 
     file_location_previous = prev_file_location
 
     while True:
         try:
-            video_url = input(f"{Tcolors.cyan}\nPlease enter a YouTube video URL: {Tcolors.clear}").strip()
+            video_urls = get_video_urls()
         except Exception as video_id:
-            logger.error(f"An error occurred: {video_id}")
+            if logger.isEnabledFor(logging.ERROR):
+                logger.error(f"An error occurred: {video_id}")
+            video_urls = []
 
         if not file_location_previous:
             file_location_prompt = "Enter file location to save files: "
@@ -229,37 +674,75 @@ def run(prev_file_location: Optional[str] = None) -> None:
             file_location = file_location_previous
 
         file_location = file_location.replace("\\", "/") if os.name == 'nt' else file_location.replace("\\", os.sep)
-        sanitized_location = sanitize_file_path(file_location)
+        sanitized_location = os.path.normpath(file_location)
 
-        if not is_valid_url(video_url):
-            print(f"{Tcolors.red}Error: Invalid YouTube video URL{Tcolors.clear}")
+        if not video_urls or not all(is_valid_url(url) for url in video_urls):
+            print(f"{Tcolors.red}Error: One or more YouTube video URLs are invalid{Tcolors.clear}")
             continue
 
-        if not is_valid_directory(sanitized_location):
+        if not os.path.isdir(sanitized_location):
             print(f"{Tcolors.red}Error: Invalid file location{Tcolors.clear}")
             continue
 
-        download_video_with_options(video_url, sanitized_location, get_user_options())
-        move_thumbnails(sanitized_location, os.path.join(sanitized_location, 'thumbnails'))
-        remove_ytdl_files(sanitized_location)
+        download_batch(video_urls, sanitized_location, get_user_options(), workers, fragment_workers,
+                       ffmpeg_threads)
         clear_console()
-        start_again(sanitized_location)
+        start_again()
+        file_location_previous = sanitized_location
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="YouTube Downloader")
+    parser.add_argument('-a', '--batch-file', metavar='PATH',
+                        help="file with one YouTube URL per line ('#' lines are comments); "
+                             "downloads run without interactive prompts")
+    parser.add_argument('--urls', nargs='+', metavar='URL',
+                        help="YouTube URLs to download without interactive prompts")
+    parser.add_argument('-o', '--output-dir', default='.',
+                        help="where to save files in batch mode (default: current directory)")
+    parser.add_argument('--workers', type=int, default=DEFAULT_WORKERS,
+                        help=f"number of parallel downloads (default: {DEFAULT_WORKERS})")
+    parser.add_argument('--fragment-workers', type=int, default=DEFAULT_FRAGMENT_WORKERS,
+                        help=f"number of HLS/DASH fragments to fetch in parallel per download "
+                             f"(default: {DEFAULT_FRAGMENT_WORKERS})")
+    parser.add_argument('--ffmpeg-threads', type=int, default=None,
+                        help="thread cap per ffmpeg invocation "
+                             "(default: cpu count divided by --workers)")
+    parser.add_argument('--clear-cache', action='store_true',
+                        help="clear the cached video metadata and exit")
+    return parser.parse_args()
 
 
 if __name__ == '__main__':
     try:
+        args = parse_args()
+        if args.clear_cache:
+            metadata_cache.clear()
+            print("Metadata cache cleared")
+            sys.exit()
         configure_logging()
+        if args.batch_file or args.urls:
+            batch_urls = list(args.urls or [])
+            if args.batch_file:
+                batch_urls.extend(read_batch_file(args.batch_file))
+            run_batch(batch_urls, args.output_dir,
+                      workers=max(1, args.workers), fragment_workers=max(1, args.fragment_workers),
+                      ffmpeg_threads=args.ffmpeg_threads)
+            sys.exit()
         first_clear()
-        run()
+        run(workers=max(1, args.workers), fragment_workers=max(1, args.fragment_workers),
+            ffmpeg_threads=args.ffmpeg_threads)
     except KeyboardInterrupt:
         print('\nInterrupted')
-        while True:
-            clear_console()
+        sys.exit(130)  # 128 + SIGINT
 
     except (FileNotFoundError, PermissionError) as e:
-        logger.error(f"Error occurred: {e}")
+        if logger.isEnabledFor(logging.ERROR):
+            logger.error(f"Error occurred: {e}")
         print(f"{Tcolors.red}Error: {e}{Tcolors.clear}")
-        time.sleep(10)
+        if sys.stdout.isatty():
+            # Leave the message on screen for interactive users only
+            time.sleep(10)
         close()
     except OSError as e:
         print(f"{Tcolors.red}Error: {e}{Tcolors.clear}")